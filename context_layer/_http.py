@@ -0,0 +1,30 @@
+# context_layer/_http.py
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# (connect, read) timeout in seconds applied to every request
+TIMEOUT = (3, 7)
+
+# One pooled, keep-alive session shared by every HTTP client in the project
+SESSION = requests.Session()
+SESSION.headers.update({
+    "Accept-Encoding": "gzip",
+    "User-Agent": "ctx-news/1.0"
+})
+_adapter = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=64,
+    # raise_on_status=False hands the last error response back to the caller,
+    # which already reports non-200 statuses
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(["GET"]),
+        raise_on_status=False
+    )
+)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
@@ -0,0 +1,101 @@
+# context_layer/async_fetch.py
+
+import asyncio
+import orjson
+from utils.config import get_config
+from .cache import make_key
+from .fetch_news import (
+    BATCH_NEWS_LIMIT, NEWS_TTL, batch_cache_key, bucket_news_by_symbol, cached_batch_news, news_cache
+)
+
+
+async def fetch_json(session, url: str):
+    """
+    GETs a URL with an aiohttp session and returns the decoded JSON body.
+    Returns None if the request fails or the status is not 200.
+    """
+    try:
+        async with session.get(url) as response:
+            if response.status == 200:
+                return await response.json(content_type=None, loads=orjson.loads)
+            print(f"⚠️ Request error {response.status}: {await response.text()}")
+    except Exception as e:
+        print(f"⚠️ Async request failed: {e}")
+    return None
+
+
+async def get_company_news_async(session, symbol: str):
+    """
+    Async counterpart of fetch_news.get_company_news.
+    Tries StockData.org first and falls back to NewsAPI, sharing the same cache.
+    """
+    cache_key = make_key("news/all", symbol)
+    cached = news_cache.get(cache_key)
+    if cached:
+        return cached
+
+    api_token = get_config().stockdata_key
+    if not api_token:
+        print("⚠️ Warning: Missing STOCKDATA_API_KEY in environment variables")
+        return []
+
+    # Try StockData.org
+    print(f"📰 Fetching company news from StockData.org for {symbol}...")
+    url = f"https://api.stockdata.org/v1/news/all?symbols={symbol}&language=en&api_token={api_token}"
+    payload = await fetch_json(session, url)
+    data = (payload or {}).get("data", [])
+    if data:
+        news_cache.set(cache_key, data, ttl=NEWS_TTL)
+        return data
+
+    # Fallback to NewsAPI
+    newsapi_key = get_config().newsapi_key
+    if newsapi_key:
+        print(f"🗞️ Falling back to NewsAPI for {symbol}...")
+        url = f"https://newsapi.org/v2/everything?q={symbol}&language=en&sortBy=publishedAt&apiKey={newsapi_key}"
+        payload = await fetch_json(session, url)
+        formatted = [
+            {
+                "title": a["title"],
+                "description": a.get("description", ""),
+                "url": a["url"]
+            }
+            for a in (payload or {}).get("articles", [])
+        ]
+        if formatted:
+            news_cache.set(cache_key, formatted, ttl=NEWS_TTL)
+            return formatted
+
+    print(f"⚠️ No data returned from any source for {symbol}.")
+    return []
+
+
+async def get_company_news_multi_async(session, symbols, limit: int = BATCH_NEWS_LIMIT):
+    """
+    Async counterpart of fetch_news.get_company_news_multi.
+    One StockData.org request (a single page of `limit` articles shared by all symbols)
+    covers every uncached symbol; the rest fall back concurrently.
+    """
+    result = {}
+    missing = []
+    for symbol in dict.fromkeys(symbols):
+        cached = cached_batch_news(symbol)
+        if cached:
+            result[symbol] = cached
+        else:
+            missing.append(symbol)
+
+    api_token = get_config().stockdata_key
+    if missing and api_token:
+        print(f"📰 Fetching company news from StockData.org for {', '.join(missing)}...")
+        url = f"https://api.stockdata.org/v1/news/all?symbols={','.join(missing)}&limit={limit}&language=en&api_token={api_token}"
+        payload = await fetch_json(session, url)
+        for symbol, articles in bucket_news_by_symbol((payload or {}).get("data", []), missing).items():
+            if articles:
+                news_cache.set(batch_cache_key(symbol), articles, ttl=NEWS_TTL)
+                result[symbol] = articles
+
+    leftover = [symbol for symbol in missing if symbol not in result]
+    fallbacks = await asyncio.gather(*(get_company_news_async(session, s) for s in leftover))
+    result.update(zip(leftover, fallbacks))
+    return result
@@ -0,0 +1,87 @@
+# context_layer/cache.py
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+# Cache lives next to the .env file in the project root
+CACHE_ROOT = Path(__file__).parent.parent / ".cache"
+
+
+def make_key(endpoint: str, symbol: str, params: str = "") -> str:
+    """
+    Builds a stable cache key for an API call.
+    """
+    return hashlib.md5(f"{endpoint}:{symbol}:{params}".encode()).hexdigest()
+
+
+class FileCache:
+    """
+    JSON-on-disk cache with per-entry TTLs.
+
+    Entries are stored under .cache/<namespace>/<key>.json as
+    {"ts": epoch, "ttl": seconds, "data": ...}. Recently used entries are
+    also kept in memory so repeated lookups in one process skip the disk.
+    """
+
+    def __init__(self, namespace: str, max_memory_entries: int = 512):
+        self.directory = CACHE_ROOT / namespace
+        self.max_memory_entries = max_memory_entries
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def _remember(self, key: str, entry: dict):
+        with self._lock:
+            self._memory[key] = entry
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_memory_entries:
+                self._memory.popitem(last=False)
+
+    def get(self, key: str):
+        """
+        Returns the cached data for key, or None if missing or expired.
+        """
+        with self._lock:
+            entry = self._memory.get(key)
+        if entry is None:
+            try:
+                with open(self._path(key), encoding="utf-8") as f:
+                    entry = json.load(f)
+            except (OSError, ValueError):
+                return None
+            if not isinstance(entry, dict):
+                return None  # not written by FileCache; treat as a miss
+            self._remember(key, entry)
+
+        if time.time() - entry.get("ts", 0) > entry.get("ttl", 0):
+            with self._lock:
+                self._memory.pop(key, None)
+            return None
+        return entry.get("data")
+
+    def set(self, key: str, data, ttl: int):
+        """
+        Stores data under key for ttl seconds.
+        """
+        entry = {"ts": time.time(), "ttl": ttl, "data": data}
+        self._remember(key, entry)
+        path = self._path(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            print(f"⚠️ Cache write failed: {e}")
+            try:
+                tmp_path.unlink(missing_ok=True)
+            except OSError:
+                pass
@@ -1,53 +1,152 @@
 # context_layer/context_merger.py
 
-import requests
-from textblob import TextBlob
+import asyncio
+import hashlib
+import re
+import orjson
+from .sentiment_engine import classify_sentiment, label_sentiment, polarity_score
 from .fetch_news import get_company_news
-import os
-from pathlib import Path
-from dotenv import load_dotenv
-
-# Load environment variables from .env file in the project root
-# Try multiple paths to ensure we find the .env file
-project_root = Path(__file__).parent.parent
-env_path = project_root / '.env'
-if env_path.exists():
-    load_dotenv(dotenv_path=env_path)
-else:
-    # Fallback: try loading from current directory
-    load_dotenv(dotenv_path='.env')
+from .async_fetch import fetch_json, get_company_news_multi_async
+from .cache import FileCache, make_key
+from ._http import SESSION, TIMEOUT
+from utils.config import get_config
+
+ENTITY_TTL = 30 * 86400  # 30 days; ticker lookups rarely change
+entity_cache = FileCache("stockdata")
+
+
+# Candidate sentence boundary: ., ! or ? (plus closing quotes/brackets) followed by whitespace
+_SENTENCE_BREAK = re.compile(r'[.!?]["\')\]]*\s+')
+# Initials such as "U.S" or "J" (the final period is matched separately)
+_INITIALS = re.compile(r'(?:[A-Z]\.)*[A-Z]')
+# Abbreviations common in financial news that end in a period mid-sentence,
+# matched in any case
+_ABBREVIATIONS = frozenset({
+    "inc", "corp", "ltd", "llc", "plc", "bros", "hldgs", "intl",
+    "mr", "mrs", "ms", "dr", "jr", "sr", "vs", "approx",
+    "jan", "feb", "apr", "jun", "jul", "aug", "sep", "sept", "oct", "nov", "dec"
+})
+# Abbreviations that are also ordinary lowercase words ("no.", "co."), matched exactly
+_CASED_ABBREVIATIONS = frozenset({"No", "Co", "CO", "Est", "St", "Mar"})
+# Everything except word characters and spaces, stripped before comparing titles
+_TITLE_NOISE = re.compile(r'[^\w ]')
 
 # Optional: if you want to auto-resolve names like "Apple" → "AAPL"
 def resolve_symbol(company_name: str) -> str:
-    api_token = os.getenv("STOCKDATA_API_KEY")
+    api_token = get_config().stockdata_key
     if not api_token:
         # If no API key, return the company name as-is (uppercase if it looks like a symbol)
         return company_name.upper() if len(company_name) <= 5 and company_name.isalpha() else company_name
     
+    cache_key = make_key("entity/search", company_name)
+    cached = entity_cache.get(cache_key)
+    if cached:
+        return cached
+
     url = f"https://api.stockdata.org/v1/entity/search?search={company_name}&api_token={api_token}"
     try:
-        resp = requests.get(url)
+        resp = SESSION.get(url, timeout=TIMEOUT)
         if resp.status_code == 200:
-            data = resp.json()
+            data = orjson.loads(resp.content)
             if data.get("data"):
-                return data["data"][0]["symbol"]
+                symbol = data["data"][0]["symbol"]
+                entity_cache.set(cache_key, symbol, ttl=ENTITY_TTL)
+                return symbol
     except Exception as e:
         print(f"⚠️ Error resolving symbol: {e}")
     return company_name  # fallback if API fails
 
 
-def analyze_context(symbol_or_name: str):
+async def resolve_symbol_async(session, company_name: str) -> str:
     """
-    Fetches company news, summarizes it, and classifies sentiment.
+    Async counterpart of resolve_symbol using a shared aiohttp session.
     """
-    symbol = resolve_symbol(symbol_or_name) or symbol_or_name.upper()
+    api_token = get_config().stockdata_key
+    if not api_token:
+        return company_name.upper() if len(company_name) <= 5 and company_name.isalpha() else company_name
+
+    cache_key = make_key("entity/search", company_name)
+    cached = entity_cache.get(cache_key)
+    if cached:
+        return cached
+
+    url = f"https://api.stockdata.org/v1/entity/search?search={company_name}&api_token={api_token}"
+    data = await fetch_json(session, url)
+    if data and data.get("data"):
+        symbol = data["data"][0]["symbol"]
+        entity_cache.set(cache_key, symbol, ttl=ENTITY_TTL)
+        return symbol
+    return company_name  # fallback if API fails
+
+
+def _pick_symbol(symbol_or_name: str, resolved: str) -> str:
+    symbol = resolved or symbol_or_name.upper()
     if len(symbol) > 5 and not symbol.isupper():  # crude check
         symbol = symbol_or_name.upper()
+    return symbol
+
+
+def analyze_context(symbol_or_name: str):
+    """
+    Fetches company news, summarizes it, and classifies sentiment.
+    """
+    symbol = _pick_symbol(symbol_or_name, resolve_symbol(symbol_or_name))
 
     print(f"🧠 Running context analysis for {symbol} ...")
 
     # Step 1: Fetch news
     news_data = get_company_news(symbol)
+    return _build_context(symbol_or_name, news_data)
+
+
+async def analyze_context_many_async(symbols_or_names):
+    """
+    Runs analyze_context for several symbols at once.
+    Symbols are resolved concurrently and their news is fetched with one batched request.
+    Returns the results in the same order as the input.
+    """
+    # aiohttp is only needed for batch analysis, so load it on first use
+    import aiohttp
+
+    connector = aiohttp.TCPConnector(limit=32)
+    timeout = aiohttp.ClientTimeout(sock_connect=TIMEOUT[0], sock_read=TIMEOUT[1])
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        resolved = await asyncio.gather(*(resolve_symbol_async(session, s) for s in symbols_or_names))
+        symbols = [_pick_symbol(n, r) for n, r in zip(symbols_or_names, resolved)]
+
+        print(f"🧠 Running context analysis for {', '.join(symbols)} ...")
+
+        news_by_symbol = await get_company_news_multi_async(session, symbols)
+    return [_build_context(n, news_by_symbol.get(s, [])) for n, s in zip(symbols_or_names, symbols)]
+
+
+def analyze_context_many(symbols_or_names):
+    """
+    Blocking wrapper around analyze_context_many_async.
+    Use the async version directly when already inside an event loop.
+    """
+    return asyncio.run(analyze_context_many_async(symbols_or_names))
+
+
+def _dedupe_news(news_data):
+    """
+    Drops wire reprints: articles whose normalized title was already seen.
+    """
+    seen = set()
+    unique = []
+    for n in news_data:
+        title = n.get("title")
+        if title:
+            key = hashlib.blake2b(_TITLE_NOISE.sub('', title.lower()).encode(), digest_size=8).digest()
+            if key in seen:
+                continue
+            seen.add(key)
+        unique.append(n)
+    return unique
+
+
+def _build_context(symbol_or_name: str, news_data):
+    news_data = _dedupe_news(news_data or [])
     if not news_data or len(news_data) == 0:
         return {
             "symbol": symbol_or_name,
@@ -58,11 +157,15 @@ def analyze_context(symbol_or_name: str):
 
     # Step 2: Summarize text
     summaries = [n["title"] + " " + n.get("description", "") for n in news_data if n.get("title")]
-    full_text = " ".join(summaries)[:4000]  # Limit to safe token size
+    full_text = " ".join(summaries)
+    if len(full_text) > 4000:
+        # Limit to safe size, cutting at the last full sentence when there is one
+        full_text = full_text[:full_text.rfind('.', 0, 4000) + 1 or 4000]
     summary = summarize_text(full_text)
 
-    # Step 3: Classify sentiment
-    sentiment = classify_sentiment(full_text)
+    # Step 3: Classify sentiment per article and average, so no article is truncated away
+    scores = [polarity_score(t) for t in summaries]
+    sentiment = label_sentiment(sum(scores) / len(scores)) if scores else "neutral"
 
     # Step 4: Package structured output
     return {
@@ -79,19 +182,35 @@ def summarize_text(text):
     """
     if not text:
         return "No summary available."
-    # For simplicity using TextBlob’s basic noun phrase extraction
-    blob = TextBlob(text)
-    sentences = blob.sentences
-    return " ".join(str(s) for s in sentences[:3])  # first 3 sentences
+    # Already three sentences or fewer: nothing to trim
+    if text.count('.') + text.count('!') + text.count('?') <= 3:
+        return text
+    return " ".join(_first_sentences(text, 3))
 
 
-def classify_sentiment(text):
-    """
-    Uses TextBlob polarity score to classify sentiment.
-    """
-    polarity = TextBlob(text).sentiment.polarity
-    if polarity > 0.1:
-        return "positive"
-    elif polarity < -0.1:
-        return "negative"
-    return "neutral"
+def _first_sentences(text, count):
+    sentences = []
+    start = 0
+    for match in _SENTENCE_BREAK.finditer(text):
+        if text[match.start()] == '.' and _ends_with_abbreviation(text[start:match.start()]):
+            continue
+        sentences.append(text[start:match.end()].strip())
+        start = match.end()
+        if len(sentences) == count:
+            return sentences
+    if text[start:].strip():
+        sentences.append(text[start:].strip())
+    return sentences
+
+
+def _ends_with_abbreviation(chunk):
+    words = chunk.split()
+    if not words:
+        return False
+    word = words[-1].lstrip('"\'(')
+    return (
+        word.lower() in _ABBREVIATIONS
+        or word in _CASED_ABBREVIATIONS
+        or bool(_INITIALS.fullmatch(word))
+    )
+
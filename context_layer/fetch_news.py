@@ -1,26 +1,27 @@
 # context_layer/fetch_news.py
 
-import requests
-import os
-from pathlib import Path
-from dotenv import load_dotenv
-
-# Load environment variables from .env file in the project root
-# Try multiple paths to ensure we find the .env file
-project_root = Path(__file__).parent.parent
-env_path = project_root / '.env'
-if env_path.exists():
-    load_dotenv(dotenv_path=env_path)
-else:
-    # Fallback: try loading from current directory
-    load_dotenv(dotenv_path='.env')
+from concurrent.futures import ThreadPoolExecutor
+import orjson
+from utils.config import get_config
+from .cache import FileCache, make_key
+from ._http import SESSION, TIMEOUT
+
+NEWS_TTL = 3600  # 1 hour
+BATCH_NEWS_LIMIT = 50  # articles per combined request, shared by every symbol in it
+news_cache = FileCache("stockdata")
 
 def get_company_news(symbol: str):
     """
     Fetches company news from StockData.org.
     Falls back to NewsAPI if StockData.org returns no data.
+    Results are cached on disk for NEWS_TTL seconds.
     """
-    api_token = os.getenv("STOCKDATA_API_KEY")
+    cache_key = make_key("news/all", symbol)
+    cached = news_cache.get(cache_key)
+    if cached:
+        return cached
+
+    api_token = get_config().stockdata_key
     if not api_token:
         print("⚠️ Warning: Missing STOCKDATA_API_KEY in environment variables")
         print("💡 To use this feature, create a .env file in the project root with:")
@@ -31,10 +32,11 @@ def get_company_news(symbol: str):
     url = f"https://api.stockdata.org/v1/news/all?symbols={symbol}&language=en&api_token={api_token}"
     try:
         print(f"📰 Fetching company news from StockData.org for {symbol}...")
-        response = requests.get(url)
+        response = SESSION.get(url, timeout=TIMEOUT)
         if response.status_code == 200:
-            data = response.json().get("data", [])
+            data = orjson.loads(response.content).get("data", [])
             if data:
+                news_cache.set(cache_key, data, ttl=NEWS_TTL)
                 return data
         else:
             print(f"⚠️ StockData.org error {response.status_code}: {response.text}")
@@ -42,14 +44,14 @@ def get_company_news(symbol: str):
         print(f"⚠️ StockData.org request failed: {e}")
 
     # Fallback to NewsAPI
-    newsapi_key = os.getenv("NEWS_API_KEY")
+    newsapi_key = get_config().newsapi_key
     if newsapi_key:
         print(f"🗞️ Falling back to NewsAPI for {symbol}...")
         try:
             url = f"https://newsapi.org/v2/everything?q={symbol}&language=en&sortBy=publishedAt&apiKey={newsapi_key}"
-            response = requests.get(url)
+            response = SESSION.get(url, timeout=TIMEOUT)
             if response.status_code == 200:
-                articles = response.json().get("articles", [])
+                articles = orjson.loads(response.content).get("articles", [])
                 formatted = [
                     {
                         "title": a["title"],
@@ -58,9 +60,95 @@ def get_company_news(symbol: str):
                     }
                     for a in articles
                 ]
+                if formatted:
+                    news_cache.set(cache_key, formatted, ttl=NEWS_TTL)
                 return formatted
         except Exception as e:
             print(f"⚠️ NewsAPI fallback failed: {e}")
 
     print("⚠️ No data returned from any source.")
     return []
+
+
+def get_company_news_batch(symbols: list[str], max_workers: int = 8) -> dict[str, list]:
+    """
+    Fetches news for several symbols concurrently using a thread pool.
+    Returns a dict mapping each symbol to its list of articles.
+    """
+    if not symbols:
+        return {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(get_company_news, symbols)
+        return dict(zip(symbols, results))
+
+
+def bucket_news_by_symbol(articles, symbols):
+    """
+    Groups StockData.org articles by the entity symbols each article is tagged with.
+    Returns a dict with an entry (possibly empty) for every requested symbol.
+    """
+    buckets = {symbol: [] for symbol in symbols}
+    requested = {symbol.upper(): symbol for symbol in symbols}
+    for article in articles:
+        tagged = {(e.get("symbol") or "").upper() for e in article.get("entities") or []}
+        for tag in tagged:
+            if tag in requested:
+                buckets[requested[tag]].append(article)
+    return buckets
+
+
+def batch_cache_key(symbol: str) -> str:
+    """
+    Cache key for a symbol's share of a combined request.
+    Kept apart from the get_company_news key because a share is only part of a page.
+    """
+    return make_key("news/all", symbol, "batch")
+
+
+def cached_batch_news(symbol: str):
+    """
+    Returns cached news usable by batch calls: a full per-symbol fetch if there is one,
+    otherwise the symbol's share of an earlier combined request.
+    """
+    return news_cache.get(make_key("news/all", symbol)) or news_cache.get(batch_cache_key(symbol))
+
+
+def get_company_news_multi(symbols: list[str], limit: int = BATCH_NEWS_LIMIT) -> dict[str, list]:
+    """
+    Fetches news for several symbols with a single StockData.org request.
+
+    The request returns one page of at most `limit` articles (StockData also caps this
+    per plan) shared by all symbols, so each symbol only gets part of it. These shares
+    are cached separately and never satisfy a later get_company_news call.
+    Symbols that get no articles from the combined request fall back to get_company_news.
+    """
+    result = {}
+    missing = []
+    for symbol in dict.fromkeys(symbols):
+        cached = cached_batch_news(symbol)
+        if cached:
+            result[symbol] = cached
+        else:
+            missing.append(symbol)
+
+    api_token = get_config().stockdata_key
+    if missing and api_token:
+        url = f"https://api.stockdata.org/v1/news/all?symbols={','.join(missing)}&limit={limit}&language=en&api_token={api_token}"
+        try:
+            print(f"📰 Fetching company news from StockData.org for {', '.join(missing)}...")
+            response = SESSION.get(url, timeout=TIMEOUT)
+            if response.status_code == 200:
+                data = orjson.loads(response.content).get("data", [])
+                for symbol, articles in bucket_news_by_symbol(data, missing).items():
+                    if articles:
+                        news_cache.set(batch_cache_key(symbol), articles, ttl=NEWS_TTL)
+                        result[symbol] = articles
+            else:
+                print(f"⚠️ StockData.org error {response.status_code}: {response.text}")
+        except Exception as e:
+            print(f"⚠️ StockData.org request failed: {e}")
+
+    for symbol in missing:
+        if symbol not in result:
+            result[symbol] = get_company_news(symbol)
+    return result
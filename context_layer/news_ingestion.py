@@ -1,7 +1,8 @@
 # context_layer/news_ingestion.py
 
-import requests
+import orjson
 from utils.config import STOCKDATA_API_KEY
+from ._http import SESSION, TIMEOUT
 
 def fetch_news_for_symbol(symbol: str, limit: int = 5):
     """
@@ -16,10 +17,10 @@ def fetch_news_for_symbol(symbol: str, limit: int = 5):
     """
     try:
         url = f"https://api.stockdata.org/v1/news/all?symbols={symbol}&limit={limit}&api_token={STOCKDATA_API_KEY}"
-        response = requests.get(url)
+        response = SESSION.get(url, timeout=TIMEOUT)
 
         if response.status_code == 200:
-            return response.json()
+            return orjson.loads(response.content)
         else:
             print(f"⚠️ Error {response.status_code}: {response.text}")
             return {"data": []}
@@ -1,6 +1,28 @@
 # context_layer/sentiment_engine.py
 
-from textblob import TextBlob
+import bisect
+import math
+from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+
+# Shared analyzer; the lexicon loads once at import and the object is thread-safe
+_SIA = SentimentIntensityAnalyzer()
+
+# Compound-score cut points separating negative | neutral | positive; both bounds
+# are strict (< -0.2 negative, > 0.2 positive), hence nextafter for bisect_right
+_THRESHOLDS = (-0.2, math.nextafter(0.2, math.inf))
+_LABELS = ("negative", "neutral", "positive")
+
+def polarity_score(text: str) -> float:
+    """
+    Returns the VADER compound score for text, in [-1, 1].
+    """
+    return _SIA.polarity_scores(text)["compound"]
+
+def label_sentiment(score: float) -> str:
+    """
+    Maps a compound score to 'positive', 'neutral', or 'negative'.
+    """
+    return _LABELS[bisect.bisect_right(_THRESHOLDS, score)]
 
 def classify_sentiment(text: str) -> str:
     """
@@ -10,10 +32,4 @@ def classify_sentiment(text: str) -> str:
     if not text:
         return "neutral"
 
-    polarity = TextBlob(text).sentiment.polarity
-    if polarity > 0.2:
-        return "positive"
-    elif polarity < -0.2:
-        return "negative"
-    else:
-        return "neutral"
+    return label_sentiment(polarity_score(text))
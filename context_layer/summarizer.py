@@ -1,25 +1,122 @@
 # context_layer/summarizer.py
 
-from openai import OpenAI
+import asyncio
+import atexit
+import functools
+import hashlib
+import threading
 from utils.config import OPENAI_API_KEY
+from .cache import FileCache
 
-client = OpenAI(api_key=OPENAI_API_KEY)
+MAX_INPUT_TOKENS = 3000
 
-def summarize_text(text: str) -> str:
-    """
-    Use GPT model to summarize stock-related news text.
-    """
+SUMMARY_TTL = 24 * 3600  # 1 day
+summary_cache = FileCache("summaries", max_memory_entries=1024)
+
+# The client's pooled connections are tied to the event loop they were opened on,
+# so every request runs on one long-lived background loop.
+_loop = None
+_loop_lock = threading.Lock()
+
+
+def _client_loop():
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="summarizer-loop", daemon=True).start()
+    return _loop
+
+
+@functools.lru_cache(maxsize=1)
+def _client():
+    # Checked up front: a failed build isn't cached, so it would otherwise
+    # leave a new HTTP client behind on every call
+    if not OPENAI_API_KEY:
+        raise RuntimeError("Missing OPENAI_API_KEY in environment variables")
+
+    # Imported on first use so importing this module stays cheap
+    import httpx
+    from openai import AsyncOpenAI
+
+    # HTTP/2 lets concurrent summaries share one multiplexed connection
+    http_client = httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+        timeout=30
+    )
+    client = AsyncOpenAI(api_key=OPENAI_API_KEY, http_client=http_client)
+    atexit.register(_close_http_client, http_client)
+    return client
+
+
+def _close_http_client(http_client):
+    if _loop is not None and _loop.is_running():
+        try:
+            asyncio.run_coroutine_threadsafe(http_client.aclose(), _loop).result(timeout=5)
+        except Exception:
+            pass
+
+
+@functools.lru_cache(maxsize=1)
+def _encoding():
+    import tiktoken
+
+    # gpt-4o-mini tokenizer, used to fit prompts to a token budget rather than a character count
+    return tiktoken.get_encoding("o200k_base")
+
+
+def _clip(text: str, max_tokens: int = MAX_INPUT_TOKENS) -> str:
+    tokens = _encoding().encode(text)
+    if len(tokens) <= max_tokens:
+        return text
+    return _encoding().decode(tokens[:max_tokens])
+
+
+async def _summarize_one(text: str) -> str:
     if not text:
         return "No text provided."
 
-    prompt = f"Summarize this financial news in under 100 words:\n\n{text[:4000]}"
+    prompt = f"Summarize this financial news in under 100 words:\n\n{_clip(text)}"
     try:
-        response = client.responses.create(
+        response = await _client().responses.create(
             model="gpt-4o-mini",
             input=prompt,
-            max_output_tokens=150
+            max_output_tokens=120
         )
         return response.output[0].content[0].text.strip()
     except Exception as e:
         print(f"❌ Summarization failed: {e}")
         return "Summary unavailable."
+
+
+async def _summarize_all(texts):
+    # Identical texts share one request; previously seen texts skip OpenAI entirely
+    hashes = [hashlib.sha1(t.encode()).hexdigest() if t else None for t in texts]
+    summaries = {h: summary_cache.get(h) for h in set(hashes) if h}
+    pending = {h: t for h, t in zip(hashes, texts) if h and summaries[h] is None}
+
+    results = await asyncio.gather(*(_summarize_one(t) for t in pending.values()))
+    for h, summary in zip(pending, results):
+        summaries[h] = summary
+        if summary != "Summary unavailable.":
+            summary_cache.set(h, summary, ttl=SUMMARY_TTL)
+
+    return [summaries[h] if h else "No text provided." for h in hashes]
+
+
+async def summarize_many(texts: list[str]) -> list[str]:
+    """
+    Summarize several news texts concurrently.
+    Returns the summaries in the same order as the input.
+    """
+    future = asyncio.run_coroutine_threadsafe(_summarize_all(texts), _client_loop())
+    return await asyncio.wrap_future(future)
+
+
+def summarize_text(text: str) -> str:
+    """
+    Use GPT model to summarize stock-related news text.
+    """
+    future = asyncio.run_coroutine_threadsafe(_summarize_all([text]), _client_loop())
+    return future.result()[0]
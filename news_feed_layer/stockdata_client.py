@@ -1,5 +1,6 @@
-import requests
+import orjson
 from utils.config import STOCKDATA_API_KEY
+from context_layer._http import SESSION, TIMEOUT
 
 BASE_URL = "https://api.stockdata.org/v1"
 
@@ -8,12 +9,12 @@ def get_company_news(symbol="AAPL", limit=5):
     Fetch latest company news using StockData.org API.
     """
     url = f"{BASE_URL}/news/all?symbols={symbol}&limit={limit}&api_token={STOCKDATA_API_KEY}"
-    response = requests.get(url)
+    response = SESSION.get(url, timeout=TIMEOUT)
 
     if response.status_code == 200:
-        data = response.json()
+        data = orjson.loads(response.content)
         if "data" in data:
-            return [article["title"] + " " + (article.get("description") or "") for article in data["data"]]
+            return [f'{article["title"]} {article.get("description") or ""}' for article in data["data"]]
         else:
             print("⚠️ No news data returned.")
             return []
@@ -0,0 +1 @@
+"""Shared utilities for stock prediction system."""
@@ -0,0 +1,79 @@
+# utils/config.py
+
+import functools
+import os
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+_env_loaded = False
+
+
+def _load_env_once():
+    """
+    Minimal .env reader: KEY=VALUE lines, '#' comments, optional quotes and 'export '.
+    Variables already set in the environment take precedence.
+    """
+    global _env_loaded
+    if _env_loaded:
+        return
+    _env_loaded = True
+
+    # Look in the project root first, then fall back to the current directory
+    env_path = Path(__file__).parent.parent / '.env'
+    if not env_path.exists():
+        env_path = Path('.env')
+    if not env_path.exists():
+        return
+
+    with open(env_path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if line.startswith("export "):
+                line = line[len("export "):]
+            key, sep, value = line.partition("=")
+            key = key.strip()
+            if not sep or not key:
+                print(f"⚠️ Skipping malformed .env line: {line}")
+                continue
+            value = value.strip()
+            if value[:1] in ("'", '"'):
+                # Quoted: keep what's inside the matching quote, ignore anything after it
+                end = value.find(value[0], 1)
+                value = value[1:end] if end != -1 else value[1:]
+            else:
+                value = re.split(r'\s+#', value, 1)[0].strip()
+            try:
+                os.environ.setdefault(key, value)
+            except (OSError, ValueError) as e:
+                print(f"⚠️ Skipping invalid .env entry {key!r}: {e}")
+
+
+_load_env_once()
+
+
+@dataclass(frozen=True)
+class Config:
+    stockdata_key: Optional[str]
+    newsapi_key: Optional[str]
+    openai_key: Optional[str]
+
+
+@functools.lru_cache(maxsize=1)
+def get_config() -> Config:
+    """
+    Returns the API keys from the environment, read once per process.
+    """
+    return Config(
+        stockdata_key=os.getenv("STOCKDATA_API_KEY"),
+        newsapi_key=os.getenv("NEWS_API_KEY"),
+        openai_key=os.getenv("OPENAI_API_KEY")
+    )
+
+
+STOCKDATA_API_KEY = get_config().stockdata_key
+NEWS_API_KEY = get_config().newsapi_key
+OPENAI_API_KEY = get_config().openai_key